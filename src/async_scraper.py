@@ -0,0 +1,234 @@
+"""
+Async HTTP helpers - Browserless YouTube page fetching
+Shared httpx client setup and ytInitialData parsing for channel links
+Works with direct imports in Jupyter notebooks
+"""
+
+import asyncio
+import itertools
+import logging
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Iterable, Iterator, List, Optional, Tuple
+
+import httpx
+import orjson
+
+# Import with absolute imports (works in notebooks and scripts)
+try:
+    from . import config
+except ImportError:
+    # Fallback for direct imports in Jupyter
+    import config_UPDATED as config
+
+logger = logging.getLogger(__name__)
+
+# JSON blob YouTube embeds in every channel page
+_YT_INIT_RE = re.compile(rb'ytInitialData\s*=\s*(\{.+?\});\s*</script>', re.DOTALL)
+
+# URLs written out in a channel description (YouTube links these as <a>)
+_DESCRIPTION_URL_RE = re.compile(r'(?:https?://|www\.)[^\s<>"\']+')
+
+
+# ==================== CLIENT SETUP ====================
+
+def new_client() -> httpx.AsyncClient:
+    """Create the shared HTTP/2 client used for all browserless requests."""
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        timeout=getattr(config, 'TIMEOUT', 10),
+        limits=httpx.Limits(max_connections=getattr(config, 'HTTP_MAX_CONNECTIONS', 64)),
+        cookies={'CONSENT': 'YES+1'},
+    )
+
+
+def user_agents() -> Iterator[str]:
+    """Endless rotation over the configured User-Agent strings."""
+    return itertools.cycle(getattr(config, 'USER_AGENTS', None) or [config.USER_AGENT])
+
+
+async def for_each(items: Iterable,
+                   worker: Callable[[httpx.AsyncClient, object, str], Awaitable],
+                   on_result: Callable[[object, object], None]):
+    """
+    Run worker(client, item, user_agent) for every item over one shared
+    client, at most HTTP_MAX_CONNECTIONS at a time, and hand each result to
+    on_result(item, result) as soon as it completes. Only the in-flight
+    items are held in memory, so callers can stream results to disk.
+    """
+    agents = user_agents()
+    remaining = iter(items)
+
+    async def drain(client):
+        for item in remaining:
+            on_result(item, await worker(client, item, next(agents)))
+
+    async with new_client() as client:
+        await asyncio.gather(
+            *(drain(client) for _ in range(getattr(config, 'HTTP_MAX_CONNECTIONS', 64)))
+        )
+
+
+def run_sync(coro):
+    """Run a coroutine to completion, even from inside Jupyter's event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+# ==================== ytInitialData PARSING ====================
+
+def parse_initial_data(body: bytes) -> Optional[dict]:
+    """
+    Extract and decode the ytInitialData JSON from a raw page body.
+
+    Args:
+        body: Raw HTML bytes
+    Returns:
+        Decoded dict, or None if the page carries no ytInitialData
+    """
+    match = _YT_INIT_RE.search(body)
+    if not match:
+        return None
+    try:
+        return orjson.loads(match.group(1))
+    except orjson.JSONDecodeError:
+        return None
+
+
+def _iter_view_models(data, name: str) -> Iterator[dict]:
+    """Yield every dict stored under key `name` anywhere in the data, in page order."""
+    queue = deque([data])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            view_model = node.get(name)
+            if isinstance(view_model, dict):
+                yield view_model
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+
+
+def _run_url(run: dict) -> Optional[str]:
+    """Target URL of one commandRuns entry, if it opens a link."""
+    return (run.get('onTap', {}).get('innertubeCommand', {})
+            .get('urlEndpoint', {}).get('url'))
+
+
+def _description_links(about: dict) -> List[Tuple[str, str]]:
+    """
+    Links in the channel description, as the browser shows them in
+    #description: linked runs first, then URLs written out in the text.
+    """
+    links = []
+    description = about.get('description') or ''
+    if isinstance(description, dict):
+        # Attributed string: linked spans carry their target in commandRuns
+        content = description.get('content', '')
+        for run in description.get('commandRuns', []):
+            raw_url = _run_url(run)
+            if raw_url:
+                start = run.get('startIndex', 0)
+                links.append((content[start:start + run.get('length', 0)], raw_url))
+        description = content
+
+    linked = {text for text, _ in links}
+    for match in _DESCRIPTION_URL_RE.finditer(description):
+        text = match.group(0).rstrip('.,;:!?)')
+        if text not in linked:
+            links.append((text, text if '://' in text else f"https://{text}"))
+    return links
+
+
+def extract_external_links(data: dict) -> Optional[List[Tuple[str, str]]]:
+    """
+    Read the channel's description and external links out of ytInitialData.
+
+    Args:
+        data: Decoded ytInitialData
+    Returns:
+        List of (title, raw_url) tuples; raw_url may be a YouTube redirect.
+        None if the page has no about panel (caller should fall back)
+    """
+    about = next(_iter_view_models(data, 'aboutChannelViewModel'), None)
+    if about is None:
+        return None
+
+    links = _description_links(about)
+    for link_vm in _iter_view_models(about, 'channelExternalLinkViewModel'):
+        title = link_vm.get('title', {}).get('content', '')
+        link = link_vm.get('link', {})
+        raw_url = None
+        for run in link.get('commandRuns', []):
+            raw_url = _run_url(run)
+            if raw_url:
+                break
+        if not raw_url and link.get('content'):
+            raw_url = link['content']
+            if '://' not in raw_url:
+                raw_url = f"https://{raw_url}"
+        if raw_url:
+            links.append((title, raw_url))
+    return links
+
+
+# ==================== CHANNEL LINKS ====================
+
+async def _fetch_links_one(client: httpx.AsyncClient, channel_url: str,
+                           user_agent: str) -> Optional[List[Tuple[str, str]]]:
+    """
+    Fetch a channel's /about page and parse its description and external links.
+
+    Returns:
+        List of (title, raw_url) tuples, or None if the page could not be
+        fetched or parsed (caller should fall back to Selenium)
+    """
+    about_url = f"{channel_url}/about"
+    try:
+        resp = await client.get(about_url, headers={'User-Agent': user_agent})
+        if resp.status_code != 200:
+            logger.warning(f"[WARN] HTTP {resp.status_code} for {about_url}")
+            return None
+
+        data = parse_initial_data(resp.content)
+        if data is None:
+            logger.warning(f"[WARN] No ytInitialData in {about_url}")
+            return None
+
+        links = extract_external_links(data)
+        if links is None:
+            logger.warning(f"[WARN] No about panel in {about_url}")
+            return None
+    except httpx.HTTPError as e:
+        logger.warning(f"[WARN] HTTP fetch failed for {about_url}: {e}")
+        return None
+    except Exception as e:
+        # One bad input (e.g. a blank cell) must not abort the batch
+        logger.warning(f"[WARN] HTTP fetch error for {about_url}: {e}")
+        return None
+
+    logger.info(f"[OK] Extracted {len(links)} links from {channel_url} (HTTP)")
+    return links
+
+
+async def fetch_external_links(
+        channel_urls: Iterable[str],
+        on_result: Callable[[str, Optional[List[Tuple[str, str]]]], None]):
+    """
+    Fetch external links for many channels concurrently.
+
+    Args:
+        channel_urls: YouTube channel URLs
+        on_result: Called with (channel_url, links) as each channel
+            completes; links is None on failure
+    """
+    await for_each(channel_urls, _fetch_links_one, on_result)
+
+
+logger.info("[OK] Async scraper module loaded successfully")
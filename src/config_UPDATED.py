@@ -4,6 +4,8 @@ YouTube Scraper Configuration
 All settings optimized for Windows & performance
 """
 
+import multiprocessing
+
 # ==================== SELENIUM SETTINGS ====================
 HEADLESS_MODE = True
 PAGE_LOAD_TIMEOUT = 15  # seconds
@@ -15,6 +17,8 @@ MAX_WORKERS = 6        # OPTIMIZED: 6 workers (Windows stable + fast)
                        # Options: 4 (conservative), 6 (balanced), 8+ (fast)
 DELAY_BETWEEN_REQUESTS = 1  # seconds (helps with rate limiting)
 MAX_RETRIES = 3        # retry attempts before giving up
+TIMEOUT = 10           # seconds (plain HTTP requests)
+HTTP_MAX_CONNECTIONS = 64  # concurrent HTTP requests for channel search
 
 # ==================== OUTPUT SETTINGS ====================
 OUTPUT_DIR = 'data/processed'
@@ -24,6 +28,12 @@ LOG_LEVEL = 'INFO'
 USE_PROXY = False
 PROXY_LIST = []
 USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+USER_AGENTS = [        # rotated across HTTP requests
+    USER_AGENT,
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+]
 
 # ==================== WINDOWS-SPECIFIC FIXES ====================
 # Set UTF-8 encoding for Windows console
@@ -37,7 +47,9 @@ CPU_CORES_TO_USE = 6          # Max CPU cores to use (matches MAX_WORKERS)
 BATCH_SIZE = 10               # Process channels in batches
 BATCH_DELAY = 5               # Delay between batches (seconds)
 
-print("[INFO] Configuration loaded successfully")
-print(f"[INFO] Max workers: {MAX_WORKERS}")
-print(f"[INFO] Headless mode: {HEADLESS_MODE}")
-print(f"[INFO] UTF-8 encoding: {WINDOWS_UTF8_ENCODING}")
+# Only report once, not again in every spawned worker process
+if multiprocessing.parent_process() is None:
+    print("[INFO] Configuration loaded successfully")
+    print(f"[INFO] Max workers: {MAX_WORKERS}")
+    print(f"[INFO] Headless mode: {HEADLESS_MODE}")
+    print(f"[INFO] UTF-8 encoding: {WINDOWS_UTF8_ENCODING}")
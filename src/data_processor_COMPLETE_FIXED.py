@@ -4,45 +4,40 @@ Handles Excel I/O, data transformation, and Windows encoding
 Works directly in Jupyter notebooks - ALL METHODS INCLUDED
 """
 
+import importlib.util
 import logging
+import re
 import pandas as pd
 from typing import List, Dict, Optional
 from pathlib import Path
 import sys
-import io
 
 # ==================== WINDOWS ENCODING FIX ====================
-# Fix UTF-8 encoding on Windows console
-if sys.platform == 'win32':
-    # Reconfigure stdout/stderr for UTF-8
+# Fix UTF-8 encoding on Windows console (in place, safe to re-import)
+if sys.platform == 'win32' and (getattr(sys.stdout, 'encoding', '') or '').lower() != 'utf-8':
     try:
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
-    except:
-        pass  # Fallback if already wrapped
+        sys.stdout.reconfigure(encoding='utf-8')
+        sys.stderr.reconfigure(encoding='utf-8')
+    except Exception:
+        pass  # Stream does not support reconfigure (e.g. replaced by a host)
+
+# ==================== EXCEL ENGINE ====================
+# Rust-based calamine reader needs python-calamine and pandas >= 2.2;
+# decided once here so read errors (e.g. a missing column) are never retried
+_PANDAS_VERSION = tuple(int(part) for part in re.findall(r'\d+', pd.__version__)[:2])
+_EXCEL_ENGINE = (
+    'calamine'
+    if _PANDAS_VERSION >= (2, 2) and importlib.util.find_spec('python_calamine')
+    else 'openpyxl'
+)
 
 # ==================== LOGGING SETUP ====================
 def setup_logging(level='INFO'):
     """
     Setup logging with Windows-compatible formatting.
-    Uses [OK], [ERROR], [WARN] instead of emoji
+    Messages use [OK], [ERROR], [WARN] prefixes instead of emoji
     """
 
-    class WindowsSafeFormatter(logging.Formatter):
-        """Formatter that works on Windows console"""
-
-        def format(self, record):
-            msg = super().format(record)
-            # Replace emoji with ASCII equivalents
-            msg = msg.replace('✅', '[OK]')
-            msg = msg.replace('❌', '[ERROR]')
-            msg = msg.replace('⚠️', '[WARN]')
-            msg = msg.replace('🔍', '[SEARCH]')
-            msg = msg.replace('📊', '[STATS]')
-            msg = msg.replace('🔗', '[LINK]')
-            msg = msg.replace('🚀', '[START]')
-            return msg
-
     logger = logging.getLogger()
     logger.setLevel(level)
 
@@ -55,7 +50,7 @@ def setup_logging(level='INFO'):
     console_handler.setLevel(level)
 
     # Format without emoji
-    formatter = WindowsSafeFormatter(
+    formatter = logging.Formatter(
         '[%(levelname)s] %(asctime)s - %(name)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -65,6 +60,27 @@ def setup_logging(level='INFO'):
     return logger
 
 
+# ==================== PLATFORM DETECTION ====================
+PLATFORM_RE = re.compile(
+    r"(instagram|tiktok|twitter|x\.com|facebook|telegram|t\.me|discord|snapchat"
+    r"|youtube\.com/channel|youtube\.com/c/)",
+    re.IGNORECASE,
+)
+PLATFORM_MAP = {
+    "instagram": "Instagram",
+    "tiktok": "TikTok",
+    "twitter": "X (Twitter)",
+    "x.com": "X (Twitter)",
+    "facebook": "Facebook",
+    "telegram": "Telegram",
+    "t.me": "Telegram",
+    "discord": "Discord",
+    "snapchat": "Snapchat",
+    "youtube.com/channel": "YouTube Channel",
+    "youtube.com/c/": "YouTube Channel",
+}
+
+
 # ==================== DATA PROCESSOR CLASS ====================
 class DataProcessor:
     """
@@ -86,8 +102,9 @@ class DataProcessor:
             List of values from column
         """
         try:
-            df = pd.read_excel(file_path)
-            items = df[column_name].tolist()
+            # Read only the needed column
+            df = pd.read_excel(file_path, engine=_EXCEL_ENGINE, usecols=[column_name])
+            items = df[column_name].to_numpy().tolist()
             logger = logging.getLogger(__name__)
             logger.info(f"[OK] Read {len(items)} items from {file_path}")
             return items
@@ -97,21 +114,31 @@ class DataProcessor:
             raise
 
     @staticmethod
-    def save_results(results: list, output_file: str, output_dir: str = 'data/processed'):
+    def save_results(results: list, output_file: str, output_dir: str = 'data/processed',
+                     fmt: str = 'xlsx'):
         """
-        Save results to Excel file
+        Save results to Excel (or Parquet) file
 
         Args:
             results: List of result dictionaries
             output_file: Output filename
             output_dir: Output directory
+            fmt: 'xlsx' (default) or 'parquet'; Parquet is much faster and
+                 ~10x smaller on disk for link/alias string data
         """
         try:
             df = pd.DataFrame(results)
             output_path = Path(output_dir) / output_file
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            df.to_excel(output_path, index=False, engine='openpyxl')
+            if fmt == 'parquet':
+                df.to_parquet(output_path, index=False, compression='zstd')
+            elif fmt == 'xlsx':
+                # pandas writes column by column, so constant_memory mode
+                # (which drops writes to already-flushed rows) must stay off
+                df.to_excel(output_path, index=False, engine='xlsxwriter')
+            else:
+                raise ValueError(f"Unsupported format: {fmt}")
 
             logger = logging.getLogger(__name__)
             logger.info(f"[OK] Saved {len(results)} results to {output_path}")
@@ -137,13 +164,19 @@ class DataProcessor:
         try:
             df = pd.DataFrame(results)
 
+            # Rows without a platform carry no link (e.g. older stream markers)
+            df = df.dropna(subset=['platform'])
+
+            # Keep the first link per platform, then pivot without aggregating
+            df = df.drop_duplicates(subset=['channel_url', 'platform'], keep='first')
+
             # Pivot so each channel is one row
-            pivot_df = df.pivot_table(
+            pivot_df = df.pivot(
                 index='channel_url',
                 columns='platform',
-                values='url',
-                aggfunc='first'
+                values='url'
             ).reset_index()
+            pivot_df.columns.name = None
 
             logger = logging.getLogger(__name__)
             logger.info(f"[OK] Pivoted {len(pivot_df)} unique channels")
@@ -155,10 +188,23 @@ class DataProcessor:
             logger.error(f"[ERROR] Failed to pivot data: {e}")
             raise
 
+    # Engagement bins: each label covers views below its upper threshold
+    VIEW_CATEGORIES = [
+        ("< 5k", 5000),
+        ("5k-10k", 10000),
+        ("10k-25k", 25000),
+        ("25k-50k", 50000),
+        ("50k-100k", 100000),
+        ("100k-250k", 250000),
+        ("250k-1M", 1000000),
+        ("1M+", float('inf')),
+    ]
+
     @staticmethod
     def categorize_views(avg_views: Optional[int]) -> str:
         """
         Categorize average views into engagement bins.
+        For whole columns prefer categorize_views_series.
 
         Args:
             avg_views: Average view count
@@ -169,25 +215,56 @@ class DataProcessor:
         if avg_views is None:
             return "N/A"
 
-        # Define categories with thresholds
-        categories = [
-            ("< 5k", 5000),
-            ("5k-10k", 10000),
-            ("10k-25k", 25000),
-            ("25k-50k", 50000),
-            ("50k-100k", 100000),
-            ("100k-250k", 250000),
-            ("250k-1M", 1000000),
-            ("1M+", float('inf')),
-        ]
-
         # Find matching category
-        for category, threshold in categories:
+        for category, threshold in DataProcessor.VIEW_CATEGORIES:
             if avg_views < threshold:
                 return category
 
         return "1M+"
 
+    @staticmethod
+    def categorize_views_series(views: pd.Series) -> pd.Series:
+        """
+        Categorize a column of average views into engagement bins (vectorized).
+        Preferred over applying categorize_views row by row.
+
+        Args:
+            views: Series of average view counts
+
+        Returns:
+            Categorical Series with the same labels as categorize_views,
+            "N/A" for missing values
+        """
+        labels = [category for category, _ in DataProcessor.VIEW_CATEGORIES]
+        bins = [float('-inf')] + [threshold for _, threshold in DataProcessor.VIEW_CATEGORIES]
+        categories = pd.cut(views, bins=bins, labels=labels, right=False)
+        return categories.cat.add_categories("N/A").fillna("N/A")
+
+    @staticmethod
+    def normalize_platforms(df: pd.DataFrame, views_column: str = 'avg_views') -> pd.DataFrame:
+        """
+        Assign a standardized platform to every link (vectorized)
+
+        Args:
+            df: Raw links with 'url' and 'platform_text' columns
+            views_column: If present, also bucket this column into 'view_bucket'
+
+        Returns:
+            DataFrame with a 'platform' column instead of 'platform_text';
+            links that match no known platform are dropped
+        """
+        urls = df['url'].fillna('')
+        # URL goes first so it wins over the link text when both match
+        lookup = urls + ' ' + df['platform_text'].fillna('')
+        platform = lookup.str.extract(PLATFORM_RE, expand=False).str.lower().map(PLATFORM_MAP)
+        platform = platform.mask(platform.isna() & urls.str.contains('@', regex=False), 'Email')
+
+        df = df.assign(platform=platform)
+        if views_column in df.columns:
+            df = df.assign(view_bucket=DataProcessor.categorize_views_series(df[views_column]))
+
+        return df[df['platform'].notna()].drop(columns='platform_text').reset_index(drop=True)
+
     @staticmethod
     def merge_dataframes(df1: pd.DataFrame, df2: pd.DataFrame, on: str = None) -> pd.DataFrame:
         """
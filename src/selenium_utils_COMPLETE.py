@@ -5,7 +5,12 @@ Helper functions for Selenium operations with error recovery
 """
 
 import logging
+import re
+import threading
 import time
+from typing import Optional
+from urllib.parse import unquote
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -16,6 +21,29 @@ from selenium.webdriver.chrome.service import Service
 
 logger = logging.getLogger(__name__)
 
+# Resolved once per process, shared by every driver
+_CHROMEDRIVER_PATH: Optional[str] = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+# Target URL carried in the q= parameter of YouTube redirect links
+_REDIRECT_RE = re.compile(r'[?&]q=([^&#]+)')
+
+# Resources never needed to read channel links (blocked at the network layer)
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif',
+    '*.woff', '*.woff2', '*.ttf', '*.css',
+    '*.mp4', '*.webm', '*googlevideo.com/*', '*i.ytimg.com/*',
+]
+
+
+def get_chrome_service():
+    """Return a chromedriver Service, installing the binary only on first call"""
+    global _CHROMEDRIVER_PATH
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    return Service(_CHROMEDRIVER_PATH)
+
 
 def create_chrome_driver(headless=True, timeout=15):
     """
@@ -45,10 +73,17 @@ def create_chrome_driver(headless=True, timeout=15):
         # Performance
         options.add_argument('--disable-extensions')
         options.add_argument('--disable-sync')
+        # Images are never needed for link extraction
+        options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+        # Return at DOMContentLoaded instead of waiting for late media
+        options.page_load_strategy = 'eager'
 
         # Setup Chrome driver
-        service = Service(ChromeDriverManager().install())
+        service = get_chrome_service()
         driver = webdriver.Chrome(service=service, options=options)
+        block_resources(driver)
 
         # Set timeouts
         driver.set_page_load_timeout(timeout)
@@ -69,6 +104,30 @@ def create_chrome_driver(headless=True, timeout=15):
             raise
 
 
+def block_resources(driver, patterns=None):
+    """Block images, fonts, stylesheets and video via CDP"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns or BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning(f'[WARN] Could not block resources: {e}')
+
+
+def navigate(driver, url):
+    """
+    Navigate to URL, letting browser errors propagate
+
+    Use this instead of safe_get where the caller retries on
+    TimeoutException / WebDriverException.
+
+    Args:
+        driver: WebDriver instance
+        url: URL to navigate to
+    """
+    logger.info(f'[INFO] Navigating to {url}')
+    driver.get(url)
+
+
 def safe_get(driver, url, timeout=10):
     """
     Safely navigate to URL with error handling
@@ -78,12 +137,40 @@ def safe_get(driver, url, timeout=10):
         url: URL to navigate to
         timeout: Navigation timeout
 
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        navigate(driver, url)
+        return True
+    except TimeoutException:
+        logger.warning(f'[WARN] Timeout loading {url}')
+        return False
+    except Exception as e:
+        logger.error(f'[ERROR] Failed to navigate to {url}: {e}')
+        return False
+
+
+def fast_get(driver, url, timeout=10):
+    """
+    Navigate the current tab via CDP and wait for the new document's DOM
+
+    Args:
+        driver: WebDriver instance
+        url: URL to navigate to
+        timeout: Load timeout
+
     Returns:
         True if successful, False otherwise
     """
     try:
         logger.info(f'[INFO] Navigating to {url}')
-        driver.get(url)
+        old_page = driver.find_element(By.TAG_NAME, 'html')
+        driver.execute_cdp_cmd('Page.navigate', {'url': url})
+        wait = WebDriverWait(driver, timeout)
+        wait.until(EC.staleness_of(old_page))
+        # DOM is ready once past 'loading' (matches the eager page load strategy)
+        wait.until(lambda d: d.execute_script('return document.readyState') != 'loading')
         return True
     except TimeoutException:
         logger.warning(f'[WARN] Timeout loading {url}')
@@ -93,6 +180,29 @@ def safe_get(driver, url, timeout=10):
         return False
 
 
+def wait_for_css(driver, selector, timeout=5):
+    """Wait until an element matching the CSS selector is present"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+        )
+        return True
+    except TimeoutException:
+        return False
+    except Exception as e:
+        logger.error(f'[ERROR] Error waiting for {selector}: {e}')
+        return False
+
+
+def page_tree(driver):
+    """Parse the current page source once so elements can be read without driver calls"""
+    try:
+        return lxml.html.fromstring(driver.page_source)
+    except Exception as e:
+        logger.error(f'[ERROR] Failed to parse page source: {e}')
+        return None
+
+
 def safe_click(driver, element, timeout=10):
     """Safely click element with error handling"""
     try:
@@ -155,17 +265,11 @@ def normalize_url(url):
 
 def clean_youtube_redirect(url):
     """Clean YouTube redirect URLs"""
-    if url and 'redirect' in url:
-        try:
-            # Extract actual URL from redirect
-            from urllib.parse import urlparse, parse_qs
-            parsed = urlparse(url)
-            params = parse_qs(parsed.query)
-            if 'q' in params:
-                return params['q'][0]
-        except:
-            pass
-    return url
+    if not url or 'redirect' not in url:
+        return url
+    # Extract actual URL from redirect
+    match = _REDIRECT_RE.search(url)
+    return unquote(match.group(1).replace('+', ' ')) if match else url
 
 
 logger.info('[INFO] Selenium utilities loaded successfully')
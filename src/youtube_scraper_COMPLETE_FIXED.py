@@ -4,24 +4,362 @@ Windows-compatible, optimized, production-ready
 Works with direct imports in Jupyter notebooks
 """
 
+import atexit
+import itertools
 import logging
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+import multiprocessing
+import os
+import re
+import threading
 import time
-from typing import Optional, List, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, List, Dict, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from multiprocessing.util import Finalize
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 import urllib.parse
+import uuid
+
+import httpx
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests
+from requests.adapters import HTTPAdapter
 
 # Import with absolute imports (works in notebooks and scripts)
 try:
     from . import config
     from . import selenium_utils as su
+    from . import async_scraper as aio
+    from . import data_processor as dp
 except ImportError:
     # Fallback for direct imports in Jupyter
     import config_UPDATED as config
     import selenium_utils_COMPLETE as su
+    import async_scraper as aio
+    import data_processor_COMPLETE_FIXED as dp
 
 logger = logging.getLogger(__name__)
 
+# ==================== DRIVER POOL ====================
+# One Chrome driver per worker (process or thread), reused across tasks
+# and quit at shutdown
+_thread_local = threading.local()
+_drivers = set()
+_drivers_lock = threading.Lock()
+
+
+def _get_driver(headless: bool = True):
+    """Return this thread's Chrome driver, creating it on first use or after a crash."""
+    driver = getattr(_thread_local, 'driver', None)
+    with _drivers_lock:
+        pooled = driver in _drivers
+    if pooled:
+        try:
+            # Liveness check, then avoid state bleeding from the previous task
+            driver.current_url
+            driver.delete_all_cookies()
+            return driver
+        except Exception as e:
+            logger.warning(f"[WARN] Pooled driver is unresponsive, replacing it: {e}")
+            _discard_driver()
+
+    # First use on this thread, the pool was shut down, or the driver died
+    driver = su.create_chrome_driver(headless=headless)
+    _thread_local.driver = driver
+    with _drivers_lock:
+        _drivers.add(driver)
+    return driver
+
+
+def _discard_driver():
+    """Quit this thread's driver so the next task starts with a fresh one."""
+    driver = getattr(_thread_local, 'driver', None)
+    if driver is not None:
+        _thread_local.driver = None
+        with _drivers_lock:
+            _drivers.discard(driver)
+        su.close_driver(driver)
+
+
+def _quit_all_drivers():
+    """Quit every driver pooled in this process (at pool shutdown and at exit)."""
+    with _drivers_lock:
+        drivers = list(_drivers)
+        _drivers.clear()
+    for driver in drivers:
+        su.close_driver(driver)
+
+
+atexit.register(_quit_all_drivers)
+
+
+def _init_worker(log_queue, log_level: int):
+    """
+    Worker process initializer: forward log records to the parent and
+    quit the process's driver when the pool shuts down.
+    """
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(log_level)
+    Finalize(None, _quit_all_drivers, exitpriority=10)
+
+
+@contextmanager
+def _process_pool(max_workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Process pool for Selenium work. Spawned (not forked) workers give
+    every Chrome a clean interpreter and behave the same on all platforms.
+    Worker log records are replayed through the parent's root handlers,
+    so they show up in the notebook like any other log line.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    log_queue = ctx.Queue()
+    root = logging.getLogger()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(log_queue, root.getEffectiveLevel()),
+        ) as executor:
+            yield executor
+    finally:
+        listener.stop()
+
+
+def _bounded_map(executor: Executor, fn: Callable, items: Iterable,
+                 window: int) -> Iterator[Tuple[object, Future]]:
+    """
+    Submit fn(item) for each item, keeping at most `window` tasks in flight.
+
+    Yields:
+        (item, future) pairs in completion order
+    """
+    items_iter = iter(items)
+    inflight = {executor.submit(fn, item): item for item in itertools.islice(items_iter, window)}
+
+    while inflight:
+        done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield inflight.pop(future), future
+        for item in itertools.islice(items_iter, len(done)):
+            inflight[executor.submit(fn, item)] = item
+
+
+# ==================== HTTP CHANNEL SEARCH ====================
+# First channel handle in the raw ytInitialData payload of a results page
+_HANDLE_RE = re.compile(rb'"canonicalBaseUrl":"(/@[^"]+)"')
+_MISSING_CHANNEL_MARKER = b'This channel does not exist'
+
+# Shared session for the HTTP probe in search_single_channel
+_http_session = requests.Session()
+_http_session.mount(
+    'https://', HTTPAdapter(pool_maxsize=getattr(config, 'MAX_WORKERS', 6))
+)
+
+def _direct_url_status(resp) -> Optional[bool]:
+    """
+    Interpret the response to a direct @alias URL.
+
+    Returns:
+        True if the channel exists, False if YouTube says it does not,
+        None if the response is not conclusive (e.g. a consent redirect)
+    """
+    if resp.status_code == 404:
+        return False
+    if resp.status_code == 200 and str(resp.url).startswith('https://www.youtube.com/@'):
+        return _MISSING_CHANNEL_MARKER not in resp.content
+    return None
+
+
+async def _search_one(client: httpx.AsyncClient, name: str,
+                      user_agent: str) -> Tuple[Optional[str], bool]:
+    """
+    Resolve a channel name to its URL with plain HTTP requests.
+
+    Args:
+        client: Shared async HTTP client
+        name: Name or alias of the channel
+        user_agent: User-Agent header for this request
+    Returns:
+        (channel URL or None if Selenium should take over,
+         whether the direct @alias URL is known not to exist)
+    """
+    headers = {'User-Agent': user_agent}
+    direct_missing = False
+    try:
+        # Try direct @alias URL first
+        alias_clean = name.strip().replace(" ", "")
+        direct_url = f"https://www.youtube.com/@{alias_clean}"
+        resp = await client.get(direct_url, headers=headers)
+        direct_status = _direct_url_status(resp)
+        if direct_status:
+            logger.info(f"[OK] Found channel: {name} -> {direct_url}")
+            return direct_url, False
+        direct_missing = direct_status is False
+
+        # Fallback to YouTube search
+        search_url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(name)}"
+        resp = await client.get(search_url, headers=headers)
+        if resp.status_code == 200:
+            match = _HANDLE_RE.search(resp.content)
+            if match:
+                channel_url = su.normalize_url(match.group(1).decode('utf-8'))
+                logger.info(f"[OK] Found channel via search: {name} -> {channel_url}")
+                return channel_url, direct_missing
+
+    except httpx.HTTPError as e:
+        logger.warning(f"[WARN] HTTP search failed for {name}: {e}")
+    except Exception as e:
+        # One bad input (e.g. a blank alias cell) must not abort the batch
+        logger.warning(f"[WARN] HTTP search error for {name}: {e}")
+
+    return None, direct_missing
+
+
+async def _search_all(names: List[str],
+                      on_result: Callable[[str, Tuple[Optional[str], bool]], None]):
+    """
+    Search all channel names concurrently over one HTTP/2 connection pool.
+
+    Args:
+        names: Channel names
+        on_result: Called with (name, (channel URL or None, direct_missing))
+            as each search completes
+    """
+    await aio.for_each(names, _search_one, on_result)
+
+
+# Raw links buffered before one vectorized platform classification pass
+_CLASSIFY_BATCH_SIZE = 1000
+
+
+# ==================== STREAMING OUTPUT ====================
+# Subdirectory of a stream holding keys processed without any data rows;
+# '_'-prefixed, so pd.read_parquet(stream_dir) does not read it as data
+_DONE_LOG_DIR = '_done'
+
+
+def _read_keys(path: Path, key: str) -> set:
+    """
+    Key column of a Parquet file, or of a directory's parts (empty if it has
+    none). Rows whose channel_url is "Error" are left out so they are retried.
+    """
+    if path.is_dir() and not any(path.glob('*.parquet')):
+        # Interrupted before its first part was written
+        return set()
+    dataset = pq.ParquetDataset(path)
+    if key == "channel_url" or "channel_url" not in dataset.schema.names:
+        return set(dataset.read(columns=[key]).column(key).to_pylist())
+    table = dataset.read(columns=[key, "channel_url"])
+    return {
+        value for value, url in zip(table.column(key).to_pylist(),
+                                    table.column("channel_url").to_pylist())
+        if url != "Error"
+    }
+
+
+def _load_done(path: Union[str, Path], key: str) -> set:
+    """Keys already processed according to a previous run's Parquet file or directory."""
+    path = Path(path)
+    if not path.exists():
+        logger.warning(f"[WARN] Resume file not found: {path}")
+        return set()
+    done = _read_keys(path, key)
+    if (path / _DONE_LOG_DIR).is_dir():
+        done |= _read_keys(path / _DONE_LOG_DIR, key)
+    logger.info(f"[INFO] Loaded {len(done)} processed entries from {path}")
+    return done
+
+
+def _load_resume(resume_from: Optional[Union[str, Path]],
+                 stream_output: Optional[Union[str, Path]], key: str) -> set:
+    """
+    Keys to skip from resume_from, read before stream_output is opened.
+    When both name the same path, the stream's own `done` already covers it.
+    """
+    if not resume_from:
+        return set()
+    if stream_output and Path(resume_from).resolve() == Path(stream_output).resolve():
+        return set()
+    return _load_done(resume_from, key)
+
+
+class _ParquetStream:
+    """
+    Write result records as they complete to a directory of small Parquet
+    part files. Each part is written to a hidden temp file and renamed into
+    place, so a crash loses at most the unflushed buffer and never rows
+    from earlier parts or runs. Keys of rows already in the directory are
+    exposed as `done` so callers can skip them (resume after a crash);
+    mark_done() records a key that produced no rows in a separate log.
+    The directory reads back as one table with pd.read_parquet(path).
+    """
+
+    def __init__(self, path: Union[str, Path], columns: List[str], key: str,
+                 flush_every: int = 100):
+        self.path = Path(path)
+        if self.path.is_file():
+            raise ValueError(f"stream_output must be a directory, not a file: {self.path}")
+
+        self.schema = pa.schema([pa.field(col, pa.string()) for col in columns])
+        self.key = key
+        self.flush_every = flush_every
+        self.done = _load_done(self.path, key) if self.path.exists() else set()
+        self._buffer = []
+        self._done_buffer = []
+        self._run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self._part = 0
+
+    def write(self, record: Dict):
+        self._buffer.append(record)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def mark_done(self, key_value: str):
+        """Record a key as processed without adding a row to the data."""
+        self._done_buffer.append({self.key: key_value})
+        if len(self._done_buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._write_part(self.path, self._buffer, self.schema)
+            self._buffer = []
+        if self._done_buffer:
+            schema = pa.schema([pa.field(self.key, pa.string())])
+            self._write_part(self.path / _DONE_LOG_DIR, self._done_buffer, schema)
+            self._done_buffer = []
+
+    def _write_part(self, directory: Path, rows: List[Dict], schema: pa.Schema):
+        table = pa.Table.from_pylist(rows, schema=schema)
+        directory.mkdir(parents=True, exist_ok=True)
+        part_path = directory / f"part-{self._run_id}-{self._part:05d}.parquet"
+        # Dot-prefixed files are ignored when the directory is read back
+        tmp_path = directory / f".{part_path.name}.tmp"
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, part_path)
+        self._part += 1
+
+    def close(self):
+        self.flush()
+
 
 class YouTubeScraper:
     """Main scraper class for YouTube channel operations."""
@@ -31,7 +369,7 @@ class YouTubeScraper:
         Initialize YouTubeScraper with optimizations.
 
         Args:
-            max_workers: Number of parallel threads (default from config)
+            max_workers: Number of parallel worker processes (default from config)
             headless: Run browser in headless mode
         """
         self.max_workers = max_workers or getattr(config, 'MAX_WORKERS', 6)
@@ -40,108 +378,184 @@ class YouTubeScraper:
 
     # ==================== CHANNEL SEARCH ====================
 
-    def search_single_channel(self, channel_name: str) -> Optional[str]:
+    def search_single_channel(self, channel_name: str, direct_missing: bool = False) -> Optional[str]:
         """
         Search for a single channel by name and return its URL.
         Includes error recovery and retry logic.
 
         Args:
             channel_name: Name or alias of the channel
+            direct_missing: The direct @alias URL is already known not to
+                exist (skips both the HTTP and the browser probe)
         Returns:
             Channel URL if found, None otherwise
         """
-        driver = None
-        retries = 0
-        max_retries = getattr(config, 'MAX_RETRIES', 3)
+        alias_clean = channel_name.strip().replace(" ", "")
+        direct_url = f"https://www.youtube.com/@{alias_clean}"
 
-        while retries < max_retries:
+        # Cheap HTTP probe of the direct @alias URL before launching Chrome.
+        # GET rather than HEAD: a 200 page may still say the channel is missing
+        probe_direct = not direct_missing
+        if probe_direct:
             try:
-                driver = su.create_chrome_driver(headless=self.headless)
-
-                # Try direct @alias URL first
-                alias_clean = channel_name.strip().replace(" ", "")
-                direct_url = f"https://www.youtube.com/@{alias_clean}"
-
-                if su.safe_get(driver, direct_url):
-                    if "404" not in driver.title and "This channel" not in driver.page_source:
-                        logger.info(f"[OK] Found channel: {channel_name} -> {direct_url}")
-                        return direct_url
-
-                # Fallback to YouTube search
-                logger.info(f"[INFO] Direct URL not found, searching for: {channel_name}")
-                search_url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(channel_name)}"
-
-                if su.safe_get(driver, search_url):
-                    delay = getattr(config, 'DELAY_BETWEEN_REQUESTS', 1)
-                    su.safe_sleep(delay)
-
-                    # Find first channel link
-                    channel_links = su.find_elements_safe(
-                        driver, By.XPATH, "//a[@href and contains(@href, '/@')]"
-                    )
-
-                    if channel_links:
-                        channel_url = su.get_attribute_safe(channel_links[0], "href")
-                        if channel_url:
-                            channel_url = su.normalize_url(channel_url)
-                            logger.info(f"[OK] Found channel via search: {channel_name} -> {channel_url}")
-                            return channel_url
-
-                logger.warning(f"[WARN] Channel not found: {channel_name}")
-                return None
-
-            except Exception as e:
-                retries += 1
-                logger.error(f"[ERROR] Error searching channel {channel_name} (attempt {retries}/{max_retries}): {e}")
-
-                if retries < max_retries:
-                    wait_time = 2 ** retries  # Exponential backoff
-                    logger.info(f"[INFO] Retrying in {wait_time} seconds...")
-                    su.safe_sleep(wait_time)
-
-            finally:
-                su.close_driver(driver)
-
-        return None
+                resp = _http_session.get(
+                    direct_url,
+                    allow_redirects=True,
+                    timeout=5,
+                    headers={'User-Agent': config.USER_AGENT},
+                )
+                direct_status = _direct_url_status(resp)
+                if direct_status:
+                    logger.info(f"[OK] Found channel: {channel_name} -> {direct_url}")
+                    return direct_url
+                # A definite answer from YouTube makes the browser probe pointless
+                probe_direct = direct_status is None
+            except requests.RequestException as e:
+                logger.warning(f"[WARN] HTTP probe failed for {channel_name}: {e}")
 
-    def search_channels(self, channel_names: List[str]) -> List[Dict]:
+        try:
+            return self._do_search(channel_name, direct_url, probe_direct)
+        except Exception as e:
+            logger.error(f"[ERROR] Error searching channel {channel_name}: {e}")
+            return None
+
+    def _search_unresolved(self, item: Tuple[str, bool]) -> Optional[str]:
+        """Selenium fallback for a (name, direct_missing) pair left by the HTTP phase."""
+        channel_name, direct_missing = item
+        return self.search_single_channel(channel_name, direct_missing)
+
+    @retry(
+        stop=stop_after_attempt(getattr(config, 'MAX_RETRIES', 3)),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        retry=retry_if_exception_type((TimeoutException, WebDriverException)),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    def _do_search(self, channel_name: str, direct_url: str, probe_direct: bool) -> Optional[str]:
+        """
+        Selenium search for one channel, retried with jittered backoff on
+        browser errors. The pooled driver is only replaced when Chrome is gone.
         """
-        Search for multiple channels in parallel with optimization.
+        driver = _get_driver(self.headless)
+        try:
+            # Try direct @alias URL first
+            if probe_direct:
+                su.navigate(driver, direct_url)
+                if "404" not in driver.title and "This channel" not in driver.page_source:
+                    logger.info(f"[OK] Found channel: {channel_name} -> {direct_url}")
+                    return direct_url
+
+            # Fallback to YouTube search
+            logger.info(f"[INFO] Direct URL not found, searching for: {channel_name}")
+            search_url = f"https://www.youtube.com/results?search_query={urllib.parse.quote(channel_name)}"
+
+            su.navigate(driver, search_url)
+            delay = getattr(config, 'DELAY_BETWEEN_REQUESTS', 1)
+            su.safe_sleep(delay)
+
+            # Find first channel link
+            channel_links = su.find_elements_safe(
+                driver, By.XPATH, "//a[@href and contains(@href, '/@')]"
+            )
+
+            if channel_links:
+                channel_url = su.get_attribute_safe(channel_links[0], "href")
+                if channel_url:
+                    channel_url = su.normalize_url(channel_url)
+                    logger.info(f"[OK] Found channel via search: {channel_name} -> {channel_url}")
+                    return channel_url
+
+            logger.warning(f"[WARN] Channel not found: {channel_name}")
+            return None
+
+        except WebDriverException as e:
+            if "disconnected" in str(e).lower():
+                _discard_driver()
+            raise
+
+    def search_channels(self, channel_names: List[str],
+                        stream_output: Optional[Union[str, Path]] = None,
+                        resume_from: Optional[Union[str, Path]] = None) -> List[Dict]:
+        """
+        Search for multiple channels with concurrent HTTP requests.
+        Channels that plain HTTP cannot resolve fall back to Selenium
+        searches in parallel worker processes.
 
         Args:
             channel_names: List of channel names
+            stream_output: Optional directory of Parquet part files that
+                receives each result as it completes; aliases already in it
+                are skipped (errors are not streamed, so they are retried)
+            resume_from: Optional Parquet output of a previous run; aliases
+                found in it are skipped, except rows recorded as "Error"
         Returns:
             List of dicts with 'alias' and 'channel_url' keys
+            (only channels processed in this call; kept in memory even
+            when streaming)
         """
         results = []
+        done = _load_resume(resume_from, stream_output, "alias")
+        stream = _ParquetStream(stream_output, ["alias", "channel_url"], "alias") if stream_output else None
+
+        try:
+            if stream:
+                done |= stream.done
+            if done:
+                skipped = len(channel_names)
+                channel_names = [name for name in channel_names if name not in done]
+                logger.info(f"[INFO] Skipping {skipped - len(channel_names)} already processed channels")
+
+            logger.info(f"[INFO] Processing {len(channel_names)} channels...")
+
+            unresolved = []
+
+            def on_searched(name: str, outcome: Tuple[Optional[str], bool]):
+                url, direct_missing = outcome
+                if url:
+                    record = {"alias": name, "channel_url": url}
+                    results.append(record)
+                    if stream:
+                        stream.write(record)
+                else:
+                    unresolved.append((name, direct_missing))
+
+            # Results are written as each request completes, not after the batch
+            aio.run_sync(_search_all(channel_names, on_searched))
+
+            logger.info(f"[INFO] HTTP search resolved {len(results)}/{len(channel_names)} channels")
+
+            if unresolved:
+                logger.info(f"[INFO] Falling back to Selenium for {len(unresolved)} channels "
+                            f"with {self.max_workers} workers")
+
+                with _process_pool(self.max_workers) as executor:
+                    completed = 0
+                    for (name, _), future in _bounded_map(
+                        executor, self._search_unresolved, unresolved, self.max_workers * 2
+                    ):
+                        try:
+                            url = future.result()
+                            record = {
+                                "alias": name,
+                                "channel_url": url if url else "Not Found"
+                            }
+                            completed += 1
+                            logger.info(f"[INFO] Progress: {completed}/{len(unresolved)}")
+
+                        except Exception as e:
+                            logger.error(f"[ERROR] Error processing {name}: {e}")
+                            record = {
+                                "alias": name,
+                                "channel_url": "Error"
+                            }
+
+                        results.append(record)
+                        if stream and record["channel_url"] != "Error":
+                            stream.write(record)
 
-        logger.info(f"[INFO] Starting parallel search with {self.max_workers} workers")
-        logger.info(f"[INFO] Processing {len(channel_names)} channels...")
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.search_single_channel, name): name
-                for name in channel_names
-            }
-
-            completed = 0
-            for future in as_completed(futures):
-                name = futures[future]
-                try:
-                    url = future.result()
-                    results.append({
-                        "alias": name,
-                        "channel_url": url if url else "Not Found"
-                    })
-                    completed += 1
-                    logger.info(f"[INFO] Progress: {completed}/{len(channel_names)}")
-
-                except Exception as e:
-                    logger.error(f"[ERROR] Error processing {name}: {e}")
-                    results.append({
-                        "alias": name,
-                        "channel_url": "Error"
-                    })
+        finally:
+            if stream:
+                stream.close()
 
         logger.info(f"[OK] Search completed! Found {sum(1 for r in results if r['channel_url'] != 'Not Found')} channels")
         return results
@@ -157,16 +571,32 @@ class YouTubeScraper:
         Returns:
             List of dicts with 'platform' and 'url' keys
         """
-        driver = None
+        results = []
+        for link in self._extract_raw_links(channel_url) or []:
+            platform = self._normalize_platform(link["platform_text"], link["url"])
+            if platform:
+                results.append({"platform": platform, "url": link["url"]})
+        return results
+
+    def _extract_raw_links(self, channel_url: str) -> Optional[List[Dict]]:
+        """
+        Collect cleaned but unclassified links from a single channel with Selenium.
+
+        Args:
+            channel_url: YouTube channel URL
+        Returns:
+            List of dicts with 'platform_text' and 'url' keys,
+            or None if the channel could not be scraped
+        """
         results = []
 
         try:
-            driver = su.create_chrome_driver(headless=self.headless)
+            driver = _get_driver(self.headless)
 
             # Visit featured/home page
             featured_url = channel_url + "/featured"
-            if not su.safe_get(driver, featured_url):
-                return []
+            if not su.fast_get(driver, featured_url):
+                return None
 
             # Try to expand "More" button in description
             try:
@@ -179,93 +609,166 @@ class YouTubeScraper:
             except:
                 pass
 
-            # Extract links from description
-            desc_links = su.find_elements_safe(driver, By.CSS_SELECTOR, "#description a")
+            # Extract links from description (parsed locally, no driver round-trips)
+            su.wait_for_css(driver, "#description a")
+            tree = su.page_tree(driver)
+            desc_links = tree.cssselect("#description a") if tree is not None else []
             for link_el in desc_links:
-                platform_text = su.get_text_safe(link_el)
-                raw_url = su.get_attribute_safe(link_el, "href")
-                clean_url = su.clean_youtube_redirect(raw_url)
-
-                if clean_url:
-                    platform = self._normalize_platform(platform_text, clean_url)
-                    if platform:
-                        results.append({
-                            "platform": platform,
-                            "url": clean_url
-                        })
+                self._add_raw_link(results, link_el.text_content().strip(), link_el.get("href"))
 
             # Visit about page for official links
             about_url = channel_url + "/about"
-            if su.safe_get(driver, about_url):
-                su.safe_sleep(1)
+            if su.fast_get(driver, about_url):
+                su.wait_for_css(driver, "#links-section")
+                tree = su.page_tree(driver)
 
                 # Find links section
-                link_elements = su.find_elements_safe(
-                    driver, By.CSS_SELECTOR, "#links-section yt-channel-external-link-view-model"
-                )
+                link_elements = tree.cssselect(
+                    "#links-section yt-channel-external-link-view-model"
+                ) if tree is not None else []
 
                 for el in link_elements:
-                    try:
-                        platform_el = el.find_element(By.CSS_SELECTOR, ".ytChannelExternalLinkViewModelTitle")
-                        platform_text = su.get_text_safe(platform_el)
-                        link_el = el.find_element(By.TAG_NAME, "a")
-                        raw_url = su.get_attribute_safe(link_el, "href")
-                        clean_url = su.clean_youtube_redirect(raw_url)
-
-                        if clean_url:
-                            platform = self._normalize_platform(platform_text, clean_url)
-                            if platform:
-                                results.append({
-                                    "platform": platform,
-                                    "url": clean_url
-                                })
-                    except:
+                    platform_els = el.cssselect(".ytChannelExternalLinkViewModelTitle")
+                    link_els = el.cssselect("a")
+                    if not platform_els or not link_els:
                         continue
+                    self._add_raw_link(
+                        results, platform_els[0].text_content().strip(), link_els[0].get("href")
+                    )
 
-            logger.info(f"[OK] Extracted {len(results)} links from {channel_url}")
+            logger.info(f"[OK] Collected {len(results)} links from {channel_url}")
 
         except Exception as e:
             logger.error(f"[ERROR] Error extracting links from {channel_url}: {e}")
-        finally:
-            su.close_driver(driver)
+            _discard_driver()
+            return None
 
         return results
 
-    def extract_social_links(self, channel_urls: List[str]) -> List[Dict]:
+    def extract_social_links(self, channel_urls: List[str],
+                             stream_output: Optional[Union[str, Path]] = None,
+                             resume_from: Optional[Union[str, Path]] = None) -> List[Dict]:
         """
-        Extract social media links from multiple channels in parallel.
+        Extract social media links from multiple channels. Description and
+        external links are read from each /about page's ytInitialData over
+        HTTP; channels whose page cannot be fetched, parsed, or has no about
+        panel fall back to Selenium in parallel worker processes.
 
         Args:
             channel_urls: List of YouTube channel URLs
+            stream_output: Optional directory of Parquet part files that
+                receives each channel's links as they complete; channels
+                already in it are skipped. Channels without links are logged
+                in its _done subdirectory (not in the data); failed channels
+                are not recorded, so they are retried
+            resume_from: Optional Parquet output of a previous run; channel
+                URLs found in it are skipped
         Returns:
             List of dicts with 'channel_url', 'platform', and 'url' keys
+            (only channels processed in this call; kept in memory even
+            when streaming)
         """
         results = []
-        logger.info(f"[INFO] Starting link extraction with {self.max_workers} workers")
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.extract_single_channel_links, url): url
-                for url in channel_urls
-            }
-
-            for future in as_completed(futures):
-                channel_url = futures[future]
-                try:
-                    links = future.result()
-                    for link_data in links:
-                        results.append({
-                            "channel_url": channel_url,
-                            **link_data
-                        })
-                except Exception as e:
-                    logger.error(f"[ERROR] Error processing {channel_url}: {e}")
+        done = _load_resume(resume_from, stream_output, "channel_url")
+        stream = _ParquetStream(
+            stream_output, ["channel_url", "platform", "url"], "channel_url"
+        ) if stream_output else None
+
+        try:
+            if stream:
+                done |= stream.done
+            if done:
+                skipped = len(channel_urls)
+                channel_urls = [url for url in channel_urls if url not in done]
+                logger.info(f"[INFO] Skipping {skipped - len(channel_urls)} already processed channels")
+
+            # Raw links are classified in vectorized batches, not per link
+            pending = []
+            pending_channels = []
+
+            def flush_pending():
+                if pending:
+                    links_df = dp.DataProcessor.normalize_platforms(
+                        pd.DataFrame(pending, columns=["channel_url", "platform_text", "url"])
+                    )
+                    records = links_df[["channel_url", "platform", "url"]].to_dict("records")
+                else:
+                    records = []
+                for record in records:
+                    results.append(record)
+                    if stream:
+                        stream.write(record)
+                if stream:
+                    # Log channels without links so they are not redone on resume
+                    with_links = {record["channel_url"] for record in records}
+                    for channel_url in pending_channels:
+                        if channel_url not in with_links:
+                            stream.mark_done(channel_url)
+                pending.clear()
+                pending_channels.clear()
+
+            def collect(channel_url: str, raw_links: List[Dict]):
+                pending_channels.append(channel_url)
+                pending.extend({"channel_url": channel_url, **link} for link in raw_links)
+                if len(pending) >= _CLASSIFY_BATCH_SIZE or (
+                        stream and len(pending_channels) >= stream.flush_every):
+                    flush_pending()
+
+            # Read links from ytInitialData over plain HTTP first
+            unresolved = []
+
+            def on_fetched(channel_url: str, raw_links: Optional[List[Tuple[str, str]]]):
+                if raw_links is None:
+                    unresolved.append(channel_url)
+                    return
+                links = []
+                for platform_text, raw_url in raw_links:
+                    self._add_raw_link(links, platform_text, raw_url)
+                collect(channel_url, links)
+
+            aio.run_sync(aio.fetch_external_links(channel_urls, on_fetched))
+
+            logger.info(f"[INFO] HTTP extraction handled {len(channel_urls) - len(unresolved)}"
+                        f"/{len(channel_urls)} channels")
+            if unresolved:
+                logger.info(f"[INFO] Falling back to Selenium for {len(unresolved)} channels "
+                            f"with {self.max_workers} workers")
+
+                # Each worker process keeps one driver for all the channels it handles
+                with _process_pool(self.max_workers) as executor:
+                    for channel_url, future in _bounded_map(
+                        executor, self._extract_raw_links, unresolved, self.max_workers * 2
+                    ):
+                        try:
+                            raw_links = future.result()
+                            if raw_links is None:
+                                logger.warning(f"[WARN] No links collected from {channel_url}")
+                                continue
+                            collect(channel_url, raw_links)
+                        except Exception as e:
+                            logger.error(f"[ERROR] Error processing {channel_url}: {e}")
+
+            flush_pending()
+
+        finally:
+            if stream:
+                stream.close()
 
         logger.info(f"[OK] Link extraction completed! Total links found: {len(results)}")
         return results
 
     # ==================== HELPER METHODS ====================
 
+    @staticmethod
+    def _add_raw_link(results: List[Dict], platform_text: str, raw_url: Optional[str]):
+        """Clean a raw link and append it to results for later classification."""
+        if not raw_url:
+            return
+        results.append({
+            "platform_text": platform_text,
+            "url": su.clean_youtube_redirect(su.normalize_url(raw_url))
+        })
+
     @staticmethod
     def _normalize_platform(platform_text: str, url: str) -> Optional[str]:
         """
@@ -277,27 +780,11 @@ class YouTubeScraper:
         Returns:
             Standardized platform name or None
         """
-        platform_lower = platform_text.lower()
-        url_lower = url.lower()
-
-        # Check known platforms
-        if "instagram" in url_lower or "instagram" in platform_lower:
-            return "Instagram"
-        elif "tiktok" in url_lower or "tiktok" in platform_lower:
-            return "TikTok"
-        elif "twitter" in url_lower or "x.com" in url_lower or "twitter" in platform_lower:
-            return "X (Twitter)"
-        elif "facebook" in url_lower or "facebook" in platform_lower:
-            return "Facebook"
-        elif "telegram" in url_lower or "t.me" in url_lower or "telegram" in platform_lower:
-            return "Telegram"
-        elif "discord" in url_lower or "discord.gg" in url_lower:
-            return "Discord"
-        elif "snapchat" in url_lower or "snapchat" in platform_lower:
-            return "Snapchat"
-        elif "youtube.com/channel" in url_lower or "youtube.com/c/" in url_lower:
-            return "YouTube Channel"
-        elif "@" in url_lower:
+        # URL goes first so it wins over the link text when both match
+        match = dp.PLATFORM_RE.search(url + " " + platform_text)
+        if match:
+            return dp.PLATFORM_MAP[match.group(1).lower()]
+        elif "@" in url:
             return "Email"
 
         return None